@@ -3,13 +3,16 @@ import logging
 import sys
 from pathlib import Path
 
-from transcriber.pipeline.pipeline import TranscriptionPipeline
 from transcriber.utils.constants import DEFAULT_INPUT_DIR
 
 logger = logging.getLogger()
 
 
 def main(input_dir: Path):
+    # Imported here so --help and argument errors exit without touching
+    # the transcription stack.
+    from transcriber.pipeline.pipeline import TranscriptionPipeline
+
     pipeline = TranscriptionPipeline(input_dir)
     pipeline.run()
 
@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from transcriber.preprocessing.audio_preprocessor import (
@@ -16,7 +17,7 @@ logger = logging.getLogger(__name__)
 class TranscriptionPipeline:
     def __init__(self, input_dir: Path):
         self.input_dir = input_dir
-        self.transcriber = Transcriber()
+        self.transcriber = Transcriber.get_instance()
 
     def run(self):
         logger.info("Scanning input directory: %s", self.input_dir)
@@ -26,18 +27,30 @@ class TranscriptionPipeline:
             return
 
         total = len(pending_files)
-        for index, (audio_file, transcript_file) in enumerate(pending_files, start=1):
-            logger.info("Processing file %s/%s: %s", index, total, audio_file)
-            processed_audio_file = prepare_audio_for_transcription(audio_file)
-
-            # Transcribe
-            transcribed_json = self.transcriber.transcribe(processed_audio_file)
-
-            # Save
-            if transcribed_json:
-                save_transcript_as_text(
-                    self.input_dir, transcript_file, transcribed_json
-                )
-                logger.info("Transcript saved: %s", transcript_file)
-            else:
-                logger.warning("Transcription failed for %s", audio_file)
+        # Preprocess the next file on a worker thread while the current one
+        # transcribes, so ffmpeg conversion stays off the critical path.
+        with ThreadPoolExecutor(max_workers=1) as preprocess_pool:
+            next_processed = preprocess_pool.submit(
+                prepare_audio_for_transcription, pending_files[0][0]
+            )
+            for index, (audio_file, transcript_file) in enumerate(
+                    pending_files, start=1
+            ):
+                logger.info("Processing file %s/%s: %s", index, total, audio_file)
+                processed_audio_file = next_processed.result()
+                if index < total:
+                    next_processed = preprocess_pool.submit(
+                        prepare_audio_for_transcription, pending_files[index][0]
+                    )
+
+                # Transcribe
+                transcript_data = self.transcriber.transcribe(processed_audio_file)
+
+                # Save
+                if transcript_data:
+                    save_transcript_as_text(
+                        self.input_dir, transcript_file, transcript_data
+                    )
+                    logger.info("Transcript saved: %s", transcript_file)
+                else:
+                    logger.warning("Transcription failed for %s", audio_file)
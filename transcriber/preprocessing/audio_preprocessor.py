@@ -1,22 +1,33 @@
 import logging
 import subprocess
 import time
+import wave
 from pathlib import Path
 from threading import Event
 from typing import Optional
 
 from transcriber.preprocessing.ffmpeg_util import get_local_ffmpeg_path
+from transcriber.utils.process_util import wait_for_process
 
 logger = logging.getLogger(__name__)
 PREPROCESS_PROGRESS_LOG_INTERVAL_SECONDS = 5.0
 
 
-def should_preprocess(audio_file: Path) -> bool:
-    if audio_file.suffix.lower() == ".wav":
-        return False
+def _is_whisper_ready_wav(audio_file: Path) -> bool:
+    """Check the WAV header instead of trusting the extension.
 
-    sibling_wav = audio_file.with_suffix(".wav")
-    return not sibling_wav.exists()
+    A 44.1kHz, stereo, or non-16-bit WAV still needs conversion before it is
+    handed to whisper.cpp; anything `wave` cannot parse is treated the same.
+    """
+    try:
+        with wave.open(str(audio_file), "rb") as wav:
+            return (
+                wav.getframerate() == 16000
+                and wav.getnchannels() == 1
+                and wav.getsampwidth() == 2
+            )
+    except (wave.Error, EOFError, OSError):
+        return False
 
 
 def preferred_wav_input(audio_file: Path) -> Path:
@@ -35,6 +46,25 @@ def preprocessed_output_path(audio_file: Path) -> Path:
     return audio_file.with_suffix("").with_suffix(".whisper.wav")
 
 
+def cached_output_is_current(source: Path, output: Path) -> bool:
+    """True when `output` exists and is at least as new as `source`.
+
+    A bare exists() check would happily reuse a conversion of an older
+    version of the recording; comparing mtimes re-runs ffmpeg when the
+    source has been replaced since the cached WAV was written.
+    """
+    try:
+        output_mtime = output.stat().st_mtime
+    except OSError:
+        return False
+    try:
+        source_mtime = source.stat().st_mtime
+    except OSError:
+        # Source vanished; the cached conversion is all we have.
+        return True
+    return output_mtime >= source_mtime
+
+
 def prepare_audio_for_transcription(
         audio_file: Path, stop_event: Optional[Event] = None
 ) -> Path:
@@ -47,7 +77,9 @@ def prepare_audio_for_transcription(
         )
 
     cached_preprocessed = preprocessed_output_path(source_audio)
-    if cached_preprocessed.exists():
+    if cached_preprocessed != source_audio and cached_output_is_current(
+            source_audio, cached_preprocessed
+    ):
         logger.info(
             "Found existing preprocessed audio for %s. Using %s",
             source_audio,
@@ -55,7 +87,10 @@ def prepare_audio_for_transcription(
         )
         return cached_preprocessed
 
-    if not should_preprocess(source_audio):
+    # At this point a non-WAV source has no sibling WAV (preferred_wav_input
+    # already checked), so only a WAV that is already in whisper format can
+    # skip conversion; the header read below doubles as its existence check.
+    if source_audio.suffix.lower() == ".wav" and _is_whisper_ready_wav(source_audio):
         logger.info("Skipping preprocessing for WAV input: %s", source_audio)
         return source_audio
 
@@ -70,14 +105,21 @@ def preprocess_audio(audio_file: Path, stop_event: Optional[Event] = None) -> Pa
     if not audio_file.exists():
         raise FileNotFoundError(f"Input file does not exist: {audio_file}")
 
-    ffmpeg_path = get_local_ffmpeg_path()
-
     output_file = preprocessed_output_path(audio_file)
 
-    if output_file.exists():
+    if output_file == audio_file:
+        # A .whisper.wav input is its own conversion target and ffmpeg
+        # refuses in-place output. Pass it through so a damaged file fails
+        # at transcription, per file, instead of aborting the batch here.
+        logger.info("Input is already a preprocessed WAV: %s", audio_file)
+        return audio_file
+
+    if cached_output_is_current(audio_file, output_file):
         logger.info("Using cached preprocessed audio: %s", output_file)
         return output_file
 
+    ffmpeg_path = get_local_ffmpeg_path()
+
     logger.info("Preprocessing %s -> %s", audio_file, output_file)
 
     command = [
@@ -85,7 +127,15 @@ def preprocess_audio(audio_file: Path, stop_event: Optional[Event] = None) -> Pa
         "-y",
         "-i",
         str(audio_file),
+        # Keep only the first audio stream: skip decoding video, subtitle,
+        # and data tracks, and drop container metadata we never read.
+        "-map",
+        "0:a:0",
         "-vn",
+        "-sn",
+        "-dn",
+        "-map_metadata",
+        "-1",
         "-ac",
         "1",
         "-ar",
@@ -104,16 +154,9 @@ def preprocess_audio(audio_file: Path, stop_event: Optional[Event] = None) -> Pa
     )
     started_at = time.time()
     next_progress_log = started_at + PREPROCESS_PROGRESS_LOG_INTERVAL_SECONDS
-    while process.poll() is None:
-        if stop_event and stop_event.is_set():
-            process.terminate()
-            try:
-                process.wait(timeout=3)
-            except subprocess.TimeoutExpired:
-                process.kill()
-                process.wait()
-            raise InterruptedError(f"Preprocessing canceled for {audio_file}")
 
+    def _log_progress():
+        nonlocal next_progress_log
         now = time.time()
         if now >= next_progress_log:
             logger.info(
@@ -122,7 +165,13 @@ def preprocess_audio(audio_file: Path, stop_event: Optional[Event] = None) -> Pa
                 now - started_at,
             )
             next_progress_log = now + PREPROCESS_PROGRESS_LOG_INTERVAL_SECONDS
-        time.sleep(0.1)
+
+    wait_for_process(
+        process,
+        stop_event=stop_event,
+        cancel_message=f"Preprocessing canceled for {audio_file}",
+        on_wait_tick=_log_progress,
+    )
 
     _, stderr = process.communicate()
     if process.returncode != 0:
@@ -1,11 +1,13 @@
 import logging
 import platform
 import shutil
+from functools import lru_cache
 import tarfile
 import tempfile
 import urllib.request
 import zipfile
 from pathlib import Path
+from threading import Lock
 
 from transcriber.utils.constants import FFMPEG_DEFAULT_ARCHIVE_NAME
 from transcriber.utils.constants import FFMPEG_PATH
@@ -16,11 +18,15 @@ from transcriber.utils.constants import FFMPEG_URL_WINDOWS
 
 logger = logging.getLogger(__name__)
 
+# ffmpeg archives run tens of MB; copy in 1MiB chunks instead of
+# copyfileobj's 64KiB default, matching the model download path.
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 def _download_file(url: str, dest: Path) -> None:
     logger.info("Downloading ffmpeg from %s", url)
     with urllib.request.urlopen(url) as response, dest.open("wb") as out_file:
-        shutil.copyfileobj(response, out_file)
+        shutil.copyfileobj(response, out_file, _DOWNLOAD_CHUNK_SIZE)
 
 
 def _extract_ffmpeg(binary_name: str, archive_path: Path, extract_dir: Path) -> Path:
@@ -59,7 +65,23 @@ def _detect_download_url(system: str, arch: str) -> tuple[str, str]:
     raise RuntimeError(f"Unsupported OS: {system}")
 
 
+# lru_cache deduplicates calls after the first returns, but two threads
+# hitting a cold cache (the preprocessing worker and the UI setup worker)
+# would both run the resolver — and both download the archive. The lock
+# serializes them; the loser re-checks the target and finds it in place.
+_resolve_lock = Lock()
+
+
+# Cached like detect_hardware_profile: the PATH walk (a stat per directory)
+# and the bundled-binary probe only need to happen once per run, not once
+# per preprocessed file.
+@lru_cache(maxsize=1)
 def get_local_ffmpeg_path() -> Path:
+    with _resolve_lock:
+        return _resolve_ffmpeg_path()
+
+
+def _resolve_ffmpeg_path() -> Path:
     system_ffmpeg = shutil.which("ffmpeg")
     if system_ffmpeg:
         resolved = Path(system_ffmpeg).resolve()
@@ -1,13 +1,14 @@
-import json
 import logging
+import os
 import re
+import selectors
 import shutil
 import subprocess
-import tempfile
 import time
 import urllib.request
 from pathlib import Path
 from threading import Event
+from threading import Lock
 from threading import Thread
 from typing import Callable, Optional
 
@@ -18,12 +19,18 @@ from transcriber.utils.constants import WHISPER_CPP_PATH
 from transcriber.utils.hardware_profile import cpu_backend_reset_flags
 from transcriber.utils.hardware_profile import detect_hardware_profile
 from transcriber.utils.hardware_profile import select_whisper_backend
+from transcriber.utils.hardware_profile import whisper_thread_count
 from transcriber.utils.model_selection import local_model_candidates
 from transcriber.utils.model_selection import min_ram_for_model
 from transcriber.utils.model_selection import repo_model_candidates
 from transcriber.utils.model_selection import select_model_for_hardware
+from transcriber.utils.process_util import terminate_process
+from transcriber.utils.process_util import wait_for_process
 
 logger = logging.getLogger(__name__)
+# Model files are ~1.5GB; copy in 1MiB chunks instead of copyfileobj's
+# 64KiB default to cut syscall overhead on fast links.
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 _RAW_WHISPER_LINE_RE = re.compile(
     r"^\[\d{2}:\d{2}:\d{2}(?:[.,]\d+)?\s+-->\s+\d{2}:\d{2}:\d{2}(?:[.,]\d+)?\]\s+.+$"
 )
@@ -34,7 +41,82 @@ def _extract_raw_transcript(stdout_lines: list[str]) -> str:
     return "\n".join(raw_lines).strip()
 
 
+def _log_output_line(sink: list[str], text: str, stream_name: str, level: int):
+    sink.append(text)
+    if text:
+        logger.log(level, "whisper.cpp %s: %s", stream_name, text)
+
+
+def _drain_stream(stream, sink: list[str], stream_name: str, level: int):
+    for raw_line in stream:
+        text = raw_line.decode("utf-8", errors="replace").rstrip()
+        _log_output_line(sink, text, stream_name, level)
+    stream.close()
+
+
+def _drain_with_selector(process, specs, stop_event, cancel_message):
+    # One selector loop in the calling thread replaces the two reader
+    # threads: one wakeup per readiness event instead of two blocked
+    # readline threads, with cancellation checked between selects.
+    sel = selectors.DefaultSelector()
+    buffers: dict = {}
+    for stream, sink, stream_name, level in specs:
+        os.set_blocking(stream.fileno(), False)
+        sel.register(stream, selectors.EVENT_READ, (sink, stream_name, level))
+        buffers[stream] = b""
+    try:
+        while sel.get_map():
+            if stop_event is not None and stop_event.is_set():
+                terminate_process(process)
+                raise InterruptedError(cancel_message)
+            for key, _ in sel.select(timeout=0.5):
+                stream = key.fileobj
+                sink, stream_name, level = key.data
+                chunk = stream.read(65536)
+                if chunk is None:
+                    # Readable but no payload yet (nonblocking read raced).
+                    continue
+                if not chunk:
+                    sel.unregister(stream)
+                    tail = buffers.pop(stream)
+                    if tail:
+                        _log_output_line(
+                            sink,
+                            tail.decode("utf-8", errors="replace").rstrip(),
+                            stream_name,
+                            level,
+                        )
+                    stream.close()
+                    continue
+                buffers[stream] += chunk
+                *complete_lines, buffers[stream] = buffers[stream].split(b"\n")
+                for raw_line in complete_lines:
+                    text = raw_line.decode("utf-8", errors="replace").rstrip()
+                    _log_output_line(sink, text, stream_name, level)
+    finally:
+        sel.close()
+
+
 class Transcriber:
+    _instance: Optional["Transcriber"] = None
+    _instance_lock = Lock()
+
+    @classmethod
+    def get_instance(
+            cls, progress_cb: Optional[Callable[[str, str, str], None]] = None
+    ) -> "Transcriber":
+        """Return the process-wide Transcriber, constructing it on first use.
+
+        Construction probes hardware, resolves the whisper.cpp binary, and may
+        bootstrap tools and download the model, so callers share one instance
+        instead of repeating that work. `progress_cb` only applies to the call
+        that actually constructs the instance.
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(progress_cb=progress_cb)
+            return cls._instance
+
     def __init__(self, progress_cb: Optional[Callable[[str, str, str], None]] = None):
         self.repo_path: Path = WHISPER_CPP_PATH
         self.progress_cb = progress_cb
@@ -69,6 +151,31 @@ class Transcriber:
             self._report("tool.repo", "Missing", str(self.repo_path))
         self.binary_path: Optional[str] = self._resolve_whisper_cpp_binary()
 
+        found_model = self._find_existing_model()
+        if found_model is not None:
+            self.model_path = found_model
+
+        # Model download and whisper.cpp bootstrap are independent, so run the
+        # download in the background while the clone/build happens below.
+        download_thread: Optional[Thread] = None
+        if found_model is None:
+            self._report("model.default", "Missing", str(self.model_path))
+            logger.info(
+                "whisper.cpp model %s not found. Downloading on first run (preferred format=%s).",
+                self.model_spec.model_id,
+                self.model_spec.format,
+            )
+            download_thread = Thread(
+                target=self._download_model,
+                kwargs={
+                    "destination": self.model_path,
+                    "source_url": self.model_spec.download_url,
+                    "model_id": self.model_spec.model_id,
+                },
+                daemon=True,
+            )
+            download_thread.start()
+
         if not self.binary_path:
             self._report("tool.repo", "Checking", str(self.repo_path))
             self._report("tool.binary", "Missing", str(WHISPER_CPP_LOCAL_BIN))
@@ -86,43 +193,31 @@ class Transcriber:
             logger.info("Using whisper.cpp binary: %s", self.binary_path)
             self._report("tool.binary", "Ready", self.binary_path)
 
-        if not self.model_path.is_file():
-            for repo_candidate in repo_model_candidates(self.model_spec):
-                if repo_candidate.is_file():
-                    self.model_path = repo_candidate
-                    break
+        if download_thread is not None:
+            download_thread.join()
+            found_model = self._find_existing_model()
+            if found_model is not None:
+                self.model_path = found_model
 
-        if not self.model_path.is_file():
-            self._report("model.default", "Missing", str(self.model_path))
-            logger.info(
-                "whisper.cpp model %s not found. Downloading on first run (preferred format=%s).",
-                self.model_spec.model_id,
-                self.model_spec.format,
-            )
-            self._download_model(
-                destination=self.model_path,
-                source_url=self.model_spec.download_url,
-                model_id=self.model_spec.model_id,
-            )
-
-        if not self.model_path.is_file():
-            for local_candidate in local_model_candidates(self.model_spec):
-                if local_candidate.is_file():
-                    self.model_path = local_candidate
-                    break
-        if not self.model_path.is_file():
-            for repo_candidate in repo_model_candidates(self.model_spec):
-                if repo_candidate.is_file():
-                    self.model_path = repo_candidate
-                    break
-
-        if self.model_path.is_file():
+        if found_model is not None:
             logger.info("Using whisper.cpp model: %s", self.model_path)
             self._report("model.default", "Ready", str(self.model_path))
         else:
             logger.error("Failed to obtain whisper.cpp model file.")
             self._report("model.default", "Failed", str(self.model_path))
 
+    def _find_existing_model(self) -> Optional[Path]:
+        # One pass over every acceptable location (preferred local file,
+        # full-precision fallback, then the whisper.cpp repo copies) instead
+        # of repeating the candidate loops at each stage of __init__.
+        for candidate in (
+                *local_model_candidates(self.model_spec),
+                *repo_model_candidates(self.model_spec),
+        ):
+            if candidate.is_file():
+                return candidate
+        return None
+
     def _report(self, item_id: str, status: str, path_text: str):
         if self.progress_cb:
             try:
@@ -245,7 +340,7 @@ class Transcriber:
         try:
             with urllib.request.urlopen(source_url, timeout=120) as response:
                 with open(temp_path, "wb") as out:
-                    shutil.copyfileobj(response, out)
+                    shutil.copyfileobj(response, out, _DOWNLOAD_CHUNK_SIZE)
             temp_path.replace(destination)
             self._report("model.default", "Ready", str(destination))
             return True
@@ -255,7 +350,7 @@ class Transcriber:
             logger.error("Failed to download whisper.cpp model %s from %s: %s", model_id, source_url, exc)
             return False
 
-    def transcribe(self, audio_file: Path, stop_event: Optional[Event] = None) -> Optional[str]:
+    def transcribe(self, audio_file: Path, stop_event: Optional[Event] = None) -> Optional[dict]:
         if stop_event and stop_event.is_set():
             raise InterruptedError(f"Transcription canceled for {audio_file}")
 
@@ -269,90 +364,76 @@ class Transcriber:
         logger.info("Transcribing with whisper.cpp: %s", audio_file)
         start_transcribe = time.time()
 
-        with tempfile.TemporaryDirectory(prefix="whispercpp_") as temp_dir:
-            output_base = Path(temp_dir) / "transcript"
-            command = [
-                self.binary_path,
-                "-m",
-                str(self.model_path),
-                "-f",
-                str(audio_file),
-                "-l",
-                DEFAULT_LANGUAGE,
-                "-oj",
-                "-of",
-                str(output_base),
-            ]
-            logger.debug("whisper.cpp command: %s", " ".join(command))
-
-            process = subprocess.Popen(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-            )
-
-            stdout_lines: list[str] = []
-            stderr_lines: list[str] = []
+        command = [
+            self.binary_path,
+            "-m",
+            str(self.model_path),
+            "-f",
+            str(audio_file),
+            "-l",
+            DEFAULT_LANGUAGE,
+            "-t",
+            str(whisper_thread_count(self.hardware_profile)),
+        ]
+        logger.debug("whisper.cpp command: %s", " ".join(command))
+
+        process = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
 
-            def _drain_stream(stream, sink: list[str], stream_name: str):
-                for line in iter(stream.readline, ""):
-                    text = line.rstrip()
-                    sink.append(text)
-                    if text:
-                        logger.info("whisper.cpp %s: %s", stream_name, text)
-                stream.close()
+        stdout_lines: list[str] = []
+        stderr_lines: list[str] = []
+        # stdout carries one line per transcript segment; log those at
+        # DEBUG so long recordings do not emit thousands of INFO records.
+        stream_specs = (
+            (process.stdout, stdout_lines, "stdout", logging.DEBUG),
+            (process.stderr, stderr_lines, "stderr", logging.INFO),
+        )
+        cancel_message = f"Transcription canceled for {audio_file}"
 
-            stdout_thread = Thread(
-                target=_drain_stream, args=(process.stdout, stdout_lines, "stdout"), daemon=True
+        if os.name == "posix":
+            _drain_with_selector(process, stream_specs, stop_event, cancel_message)
+            wait_for_process(
+                process, stop_event=stop_event, cancel_message=cancel_message
             )
-            stderr_thread = Thread(
-                target=_drain_stream, args=(process.stderr, stderr_lines, "stderr"), daemon=True
+        else:
+            # select() only understands sockets on Windows, so keep the
+            # reader-thread-per-pipe fallback there.
+            drain_threads = [
+                Thread(target=_drain_stream, args=spec, daemon=True)
+                for spec in stream_specs
+            ]
+            for drain_thread in drain_threads:
+                drain_thread.start()
+            wait_for_process(
+                process, stop_event=stop_event, cancel_message=cancel_message
             )
-            stdout_thread.start()
-            stderr_thread.start()
-
-            while process.poll() is None:
-                if stop_event and stop_event.is_set():
-                    process.terminate()
-                    try:
-                        process.wait(timeout=3)
-                    except subprocess.TimeoutExpired:
-                        process.kill()
-                        process.wait()
-                    raise InterruptedError(f"Transcription canceled for {audio_file}")
-                time.sleep(0.1)
-
-            stdout_thread.join(timeout=2)
-            stderr_thread.join(timeout=2)
+            for drain_thread in drain_threads:
+                drain_thread.join(timeout=2)
+
+        if process.returncode != 0:
+            # Only materialize the joined output when it is actually
+            # reported; on success these buffers can be large.
             stdout = "\n".join(stdout_lines).strip()
             stderr = "\n".join(stderr_lines).strip()
+            details = (stderr or stdout or "Unknown error").strip()
+            logger.error("whisper.cpp failed for %s: %s", audio_file, details)
+            return None
 
-            if process.returncode != 0:
-                details = (stderr or stdout or "Unknown error").strip()
-                logger.error("whisper.cpp failed for %s: %s", audio_file, details)
-                return None
-
-            json_output = output_base.with_suffix(".json")
-            if not json_output.is_file():
-                logger.error("whisper.cpp did not produce JSON output for %s", audio_file)
-                return None
-
-            raw_transcript = _extract_raw_transcript(stdout_lines)
-            if not raw_transcript:
-                logger.warning(
-                    "No raw transcript lines found in whisper.cpp output for %s",
-                    audio_file,
-                )
-                return None
+        raw_transcript = _extract_raw_transcript(stdout_lines)
+        if not raw_transcript:
+            logger.warning(
+                "No raw transcript lines found in whisper.cpp output for %s",
+                audio_file,
+            )
+            return None
 
         logger.info(
             "Transcription completed in %.2f seconds.",
             time.time() - start_transcribe,
         )
-        return json.dumps(
-            {
-                "raw_transcript": raw_transcript,
-            }
-        )
+        return {
+            "raw_transcript": raw_transcript,
+        }
@@ -1,4 +1,3 @@
-import json
 import logging
 import os
 import platform
@@ -222,14 +221,14 @@ class Worker(QtCore.QThread):
         with open(transcript_path, "w", encoding="utf-8") as handle:
             handle.write(text_content)
 
-    def _save_transcript_output(self, transcript_path: Path, transcribed_json: str):
-        payload = json.loads(transcribed_json)
+    def _save_transcript_output(self, transcript_path: Path, transcript_data: dict):
+        payload = transcript_data
         raw_transcript = str(payload.get("raw_transcript", "")).strip()
         text_content = raw_transcript
         self._save_txt(transcript_path, text_content)
 
     def run(self):
-        transcriber = Transcriber()
+        transcriber = Transcriber.get_instance()
         total = len(self.items)
         logger.info("Worker started. Items queued: %s", total)
 
@@ -261,12 +260,12 @@ class Worker(QtCore.QThread):
 
                 self.itemStatus.emit(path, 65, "Transcribing", index, total)
                 logger.info("Transcription started: %s", processed)
-                transcribed_json = transcriber.transcribe(
+                transcript_data = transcriber.transcribe(
                     processed, stop_event=self._stop_event
                 )
-                if transcribed_json:
+                if transcript_data:
                     self.itemStatus.emit(path, 90, "Saving", index, total)
-                    self._save_transcript_output(transcript_path, transcribed_json)
+                    self._save_transcript_output(transcript_path, transcript_data)
                     logger.info("Transcript saved: %s", transcript_path)
                     self.itemStatus.emit(path, 100, "Done", index, total)
                 else:
@@ -291,7 +290,7 @@ class SetupWorker(QtCore.QThread):
 
     def run(self):
         try:
-            transcriber = Transcriber(progress_cb=self._emit_progress)
+            transcriber = Transcriber.get_instance(progress_cb=self._emit_progress)
             if not transcriber.binary_path:
                 self.setupDone.emit(False, "Transcriber engine is unavailable.")
                 return
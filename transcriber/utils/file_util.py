@@ -1,11 +1,11 @@
-import json
 import logging
+import os
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
-# --- Supported audio/video extensions ---
-supported_file_extensions = {
+# --- Supported audio/video extensions (lowercase; compare casefolded) ---
+supported_file_extensions = frozenset({
     # Audio
     ".aac",
     ".ac3",
@@ -74,18 +74,26 @@ supported_file_extensions = {
     ".vob",
     ".webm",
     ".wmv",
-}
+})
 
 
 def is_preprocessed_whisper_audio(file: Path) -> bool:
     return file.suffix.lower() == ".wav" and file.stem.endswith(".whisper")
 
 
-def has_original_pair_for_preprocessed(file: Path) -> bool:
+def has_original_pair_for_preprocessed(
+        file: Path, sibling_names: set[str] | None = None
+) -> bool:
     if not is_preprocessed_whisper_audio(file):
         return False
 
     base_stem = file.stem[: -len(".whisper")]
+    if sibling_names is not None:
+        # Membership check against an already-listed directory; no syscalls.
+        return any(
+            f"{base_stem}{ext}" in sibling_names
+            for ext in supported_file_extensions
+        )
     for ext in supported_file_extensions:
         candidate = file.with_name(f"{base_stem}{ext}")
         if candidate != file and candidate.exists():
@@ -100,13 +108,49 @@ def transcript_path_for_audio(file: Path) -> Path:
     return file.with_suffix(".transcript.txt")
 
 
+def _iter_directory_files(folder_path: Path):
+    # os.scandir reuses the file type reported by readdir, so recursing
+    # manually avoids the per-entry stat that rglob + is_file() pays.
+    # Yielding one directory at a time lets callers resolve sibling
+    # lookups (transcripts, preprocessed pairs) against the listing
+    # instead of issuing per-candidate exists() calls.
+    stack = [str(folder_path)]
+    while stack:
+        current = stack.pop()
+        files = []
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        # Follow symlinks here: regular files still answer
+                        # from the cached d_type, and rglob transcribed
+                        # symlinked audio before this walk replaced it.
+                        files.append(entry)
+        except OSError as exc:
+            logger.debug("Skipping unreadable directory %s (%s)", current, exc)
+            continue
+        if files:
+            yield files
+
+
 def load_audio_files(folder_path: Path):
     # --- Find audio files to transcribe (recursively) ---
     pending_files = []
     seen_transcripts: set[Path] = set()
-    for file in folder_path.rglob("*"):
-        if file.suffix.lower() in supported_file_extensions and file.is_file():
-            if has_original_pair_for_preprocessed(file):
+    skipped_existing = 0
+    for dir_entries in _iter_directory_files(folder_path):
+        sibling_names = {entry.name for entry in dir_entries}
+        for entry in dir_entries:
+            # Filter on the entry name before building a Path object so
+            # non-audio files cost only one splitext + set lookup.
+            suffix = os.path.splitext(entry.name)[1].casefold()
+            if suffix not in supported_file_extensions:
+                continue
+
+            file = Path(entry.path)
+            if has_original_pair_for_preprocessed(file, sibling_names):
                 logger.debug(
                     "Skipping paired preprocessed file: %s (original exists)",
                     file,
@@ -118,20 +162,36 @@ def load_audio_files(folder_path: Path):
                 logger.debug("Skipping duplicate transcript target for %s", file)
                 continue
 
-            if transcript_file.exists():
-                logger.info("Skipping, transcript already exists: %s", transcript_file)
+            if transcript_file.name in sibling_names:
+                skipped_existing += 1
+                logger.debug(
+                    "Skipping, transcript already exists: %s", transcript_file
+                )
             else:
                 pending_files.append((file, transcript_file))
                 seen_transcripts.add(transcript_file)
 
+    if skipped_existing:
+        logger.info(
+            "Skipped %s file(s) whose transcripts already exist.", skipped_existing
+        )
     logger.info("Pending transcription files discovered: %s", len(pending_files))
     return pending_files
 
 
+def _format_offset(value) -> str:
+    # Segment offsets are normally floats; fall back to str() for anything
+    # else rather than branching per field at every segment.
+    try:
+        return f"{value:.2f}"
+    except (TypeError, ValueError):
+        return str(value)
+
+
 # TODO: Remove after the pipeline is completed
-def save_transcript_as_text(folder_path: Path, filename: str, file_content: str):
+def save_transcript_as_text(folder_path: Path, filename: str, file_content: dict):
     del folder_path
-    data = json.loads(file_content)
+    data = file_content
     raw_transcript = str(data.get("raw_transcript", "")).strip()
     if raw_transcript:
         with open(filename, "w", encoding="utf-8") as f:
@@ -139,20 +199,11 @@ def save_transcript_as_text(folder_path: Path, filename: str, file_content: str)
         return
 
     segments = data.get("transcription", [])
-    lines = []
-    for s in segments:
-        start_val = s.get("start")
-        end_val = s.get("end")
-        if isinstance(start_val, (int, float)):
-            start = f"{start_val:.2f}"
-        else:
-            start = str(start_val)
-        if isinstance(end_val, (int, float)):
-            end = f"{end_val:.2f}"
-        else:
-            end = str(end_val)
-        text = s["text"].strip()
-        lines.append(f"{start} - {end} | {text}")
-
+    # Stream one line per segment instead of materializing the whole
+    # transcript as a list plus a joined string before writing.
     with open(filename, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+        for s in segments:
+            start = _format_offset(s.get("start"))
+            end = _format_offset(s.get("end"))
+            text = s["text"].strip()
+            f.write(f"{start} - {end} | {text}\n")
@@ -189,3 +189,14 @@ def select_whisper_backend(profile: HardwareProfile) -> WhisperBackend:
 
 def cpu_backend_reset_flags() -> tuple[str, ...]:
     return ("-DGGML_CUDA=OFF", "-DGGML_METAL=OFF", "-DGGML_VULKAN=OFF")
+
+
+def whisper_thread_count(profile: HardwareProfile) -> int:
+    """Threads to pass to whisper-cli's -t flag.
+
+    whisper.cpp throughput flattens out past roughly eight threads, and the
+    pipeline keeps a preprocessing worker (plus the UI thread) busy alongside
+    the transcriber, so handing it every core just adds scheduler churn on
+    big machines.
+    """
+    return max(1, min(profile.cpu_cores, 8))
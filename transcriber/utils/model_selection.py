@@ -17,14 +17,26 @@ class WhisperModelSpec:
     download_url: str
 
 
-CONSISTENT_MODEL_ID = "medium.en"
-CONSISTENT_MODEL_FORMAT = "bin"
-CONSISTENT_MODEL_MIN_RAM_GB = 8
+DEFAULT_MODEL_ID = "medium.en"
+# Quantized weights: ~1/3 the size and memory bandwidth of the full
+# precision models with negligible accuracy loss for English transcription.
+# whisper.cpp publishes q5_0 files for medium and q5_1 for the smaller models.
+_MODEL_FORMATS = {
+    "medium.en": "q5_0",
+    "small.en": "q5_1",
+    "base.en": "q5_1",
+}
+_MODEL_MIN_RAM_GB = {
+    "medium.en": 4,
+    "small.en": 2,
+    "base.en": 2,
+}
 
 
 def _filename_for(model_id: str, model_format: str) -> str:
-    del model_format
-    return f"ggml-{model_id}.bin"
+    if model_format == "bin":
+        return f"ggml-{model_id}.bin"
+    return f"ggml-{model_id}-{model_format}.bin"
 
 
 def _build_spec(model_id: str, model_format: str) -> WhisperModelSpec:
@@ -39,21 +51,49 @@ def _build_spec(model_id: str, model_format: str) -> WhisperModelSpec:
 
 
 def min_ram_for_model(model_id: str) -> int:
-    if model_id != CONSISTENT_MODEL_ID:
-        raise ValueError(
-            f"Unsupported Whisper model_id: {model_id}. Expected {CONSISTENT_MODEL_ID}."
-        )
-    return CONSISTENT_MODEL_MIN_RAM_GB
+    try:
+        return _MODEL_MIN_RAM_GB[model_id]
+    except KeyError:
+        raise ValueError(f"Unsupported Whisper model_id: {model_id}.") from None
+
+
+def _candidate_filenames(spec: WhisperModelSpec) -> tuple[str, ...]:
+    # Prefer the spec's (quantized) format but keep accepting an already
+    # downloaded full-precision file so existing installs skip a re-download.
+    filenames = [spec.filename]
+    if spec.format != "bin":
+        filenames.append(_filename_for(spec.model_id, "bin"))
+    return tuple(filenames)
 
 
 def repo_model_candidates(spec: WhisperModelSpec) -> tuple[Path, ...]:
-    return (WHISPER_CPP_REPO_MODEL_DIR / spec.filename,)
+    return tuple(
+        WHISPER_CPP_REPO_MODEL_DIR / filename
+        for filename in _candidate_filenames(spec)
+    )
 
 
 def local_model_candidates(spec: WhisperModelSpec) -> tuple[Path, ...]:
-    return (spec.local_path,)
+    return tuple(
+        AI_MODEL_WHISPER_CPP_PATH / filename
+        for filename in _candidate_filenames(spec)
+    )
 
 
 def select_model_for_hardware(profile=None) -> WhisperModelSpec:
-    del profile
-    return _build_spec(CONSISTENT_MODEL_ID, CONSISTENT_MODEL_FORMAT)
+    """Pick the largest whisper model the machine can drive comfortably.
+
+    GPU-accelerated machines keep medium.en. CPU-only machines trade a
+    little accuracy for a model they can realistically run: medium.en on
+    big workstations, small.en on typical laptops, base.en under 8GB RAM.
+    """
+    if profile is None or profile.has_gpu:
+        return _build_spec(DEFAULT_MODEL_ID, _MODEL_FORMATS[DEFAULT_MODEL_ID])
+
+    if profile.ram_bucket == "<8GB":
+        model_id = "base.en"
+    elif profile.processing_score >= 20:
+        model_id = DEFAULT_MODEL_ID
+    else:
+        model_id = "small.en"
+    return _build_spec(model_id, _MODEL_FORMATS[model_id])
@@ -0,0 +1,52 @@
+import logging
+import subprocess
+from threading import Event
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on how long a cancellable wait blocks before rechecking the
+# stop event. Process exit still unblocks immediately; this only caps how
+# long a cancel request can go unnoticed.
+_WAIT_SLICE_SECONDS = 0.5
+_TERMINATE_GRACE_SECONDS = 3
+
+
+def terminate_process(process: subprocess.Popen):
+    """Terminate a child process, escalating to kill if it ignores the signal."""
+    process.terminate()
+    try:
+        process.wait(timeout=_TERMINATE_GRACE_SECONDS)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def wait_for_process(
+        process: subprocess.Popen,
+        stop_event: Optional[Event] = None,
+        cancel_message: str = "Child process canceled",
+        on_wait_tick: Optional[Callable[[], None]] = None,
+) -> int:
+    """Wait for a child process to exit, honoring a cancellation event.
+
+    Without a stop event (the batch pipeline case) this is a plain blocking
+    wait — no wakeups at all. With one, the wait is sliced so cancellation
+    terminates the child promptly; the exit itself still returns as soon as
+    it happens rather than at the next poll interval.
+
+    Raises InterruptedError with `cancel_message` when the stop event fires.
+    `on_wait_tick` runs once per wait slice, for callers that log progress.
+    """
+    if stop_event is None and on_wait_tick is None:
+        return process.wait()
+
+    while True:
+        try:
+            return process.wait(timeout=_WAIT_SLICE_SECONDS)
+        except subprocess.TimeoutExpired:
+            if stop_event is not None and stop_event.is_set():
+                terminate_process(process)
+                raise InterruptedError(cancel_message) from None
+            if on_wait_tick is not None:
+                on_wait_tick()
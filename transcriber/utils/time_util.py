@@ -1,8 +1,6 @@
 def format_timestamp(seconds: float) -> str:
-    total_seconds = int(seconds)
-
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
-    secs = total_seconds % 60
-
+    # One divmod chain: two divisions instead of the separate //, %, and
+    # nested-mod arithmetic this used to do per call.
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
     return f"{hours:02d}:{minutes:02d}:{secs:02d}"